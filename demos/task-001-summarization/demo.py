@@ -1,4 +1,6 @@
 # Text Summarization Demo
+import sys
+
 from yara.orchestrator import Orchestrator
 from yara.agents import SummarizationAgent
 
@@ -30,14 +32,18 @@ orchestrator = Orchestrator()
 orchestrator.register_agent("summarization", SummarizationAgent())
 result = orchestrator.execute_task(task)
 
-print("\nTask 001: Research Text Summarization")
-print("="*50)
-print("\nInput Text Length:", len(research_text))
-print("\nSummarization Results:")
-print("-"*30)
+out = []
+out.append("\nTask 001: Research Text Summarization")
+out.append("="*50)
+out.append(f"\nInput Text Length: {len(research_text)}")
+out.append("\nSummarization Results:")
+out.append("-"*30)
 for section, content in result["sections"].items():
-    print(f"\n{section.title()}:")
-    print(content)
-print("\nMetadata:")
-print(f"Compression Ratio: {result['metadata']['compression_ratio']:.2f}")
-print(f"Key Topics: {', '.join(result['metadata']['key_topics'])}")
\ No newline at end of file
+    out.append(f"\n{section.title()}:")
+    out.append(content)
+out.append("\nMetadata:")
+out.append(f"Compression Ratio: {result['metadata']['compression_ratio']:.2f}")
+out.append(f"Key Topics: {', '.join(result['metadata']['key_topics'])}")
+
+# Write the report in one call
+sys.stdout.write("\n".join(out) + "\n")
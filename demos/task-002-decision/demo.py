@@ -1,6 +1,8 @@
 # Decision Making Demo
+import sys
+
 from yara.orchestrator import Orchestrator
-from yara.agents import DecisionAgent
+from yara.agents.decision_agent import get_default_agent
 
 # Research project options
 research_options = [
@@ -47,21 +49,25 @@ task = {
 
 # Execute task
 orchestrator = Orchestrator()
-orchestrator.register_agent("decision", DecisionAgent())
+orchestrator.register_agent("decision", get_default_agent())
 result = orchestrator.execute_task(task)
 
-print("\nTask 002: Research Decision Making")
-print("="*50)
-print("\nAnalyzing Research Options:")
-print("-"*30)
+out = []
+out.append("\nTask 002: Research Decision Making")
+out.append("="*50)
+out.append("\nAnalyzing Research Options:")
+out.append("-"*30)
 
 for rec in result["recommendations"]:
-    print(f"\nOption: {rec['option']['name']}")
-    print(f"Score: {rec['score']:.2f}")
-    print(f"Reasoning: {rec['reasoning']}")
-    print("\nMetrics:")
-    print(f"- Novelty: {rec['option']['novelty']:.2f}")
-    print(f"- Research Impact: {rec['option']['research_impact']}/100")
-    print(f"- Complexity: {rec['option']['implementation_complexity']}")
-    print(f"- Features: {', '.join(rec['option']['features'])}")
-    print(f"- Cost: ${rec['option']['price']}")
\ No newline at end of file
+    out.append(f"\nOption: {rec['option']['name']}")
+    out.append(f"Score: {rec['score']:.2f}")
+    out.append(f"Reasoning: {rec['reasoning']}")
+    out.append("\nMetrics:")
+    out.append(f"- Novelty: {rec['option']['novelty']:.2f}")
+    out.append(f"- Research Impact: {rec['option']['research_impact']}/100")
+    out.append(f"- Complexity: {rec['option']['implementation_complexity']}")
+    out.append(f"- Features: {', '.join(rec['option']['features'])}")
+    out.append(f"- Cost: ${rec['option']['price']}")
+
+# Write the report in one call
+sys.stdout.write("\n".join(out) + "\n")
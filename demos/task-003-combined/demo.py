@@ -1,6 +1,10 @@
 # Combined Analysis Demo
+import asyncio
+import sys
+
 from yara.orchestrator import Orchestrator
-from yara.agents import DecisionAgent, SummarizationAgent
+from yara.agents import SummarizationAgent
+from yara.agents.decision_agent import get_default_agent
 
 # Research methodology text
 methodology_text = """
@@ -61,32 +65,44 @@ decision_task = {
 # Execute combined analysis
 orchestrator = Orchestrator()
 orchestrator.register_agent("summarization", SummarizationAgent())
-orchestrator.register_agent("decision", DecisionAgent())
+orchestrator.register_agent("decision", get_default_agent())
+
+# Both steps use independent inputs, so run them concurrently
+async def run_analysis():
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(
+        loop.run_in_executor(None, orchestrator.execute_task, summarize_task),
+        loop.run_in_executor(None, orchestrator.execute_task, decision_task),
+    )
 
-print("\nTask 003: Combined Research Analysis")
-print("="*50)
+summary_result, decision_result = asyncio.run(run_analysis())
+
+out = []
+out.append("\nTask 003: Combined Research Analysis")
+out.append("="*50)
 
 # Step 1: Summarization
-print("\nStep 1: Methodology Summary")
-print("-"*30)
-summary_result = orchestrator.execute_task(summarize_task)
-print(summary_result["sections"]["methodology"])
+out.append("\nStep 1: Methodology Summary")
+out.append("-"*30)
+out.append(summary_result["sections"]["methodology"])
 
 # Step 2: Decision Making
-print("\nStep 2: Approach Selection")
-print("-"*30)
-decision_result = orchestrator.execute_task(decision_task)
+out.append("\nStep 2: Approach Selection")
+out.append("-"*30)
 
 for rec in decision_result["recommendations"]:
-    print(f"\nRecommended: {rec['option']['name']}")
-    print(f"Confidence Score: {rec['score']:.2f}")
-    print(f"Reasoning: {rec['reasoning']}")
+    out.append(f"\nRecommended: {rec['option']['name']}")
+    out.append(f"Confidence Score: {rec['score']:.2f}")
+    out.append(f"Reasoning: {rec['reasoning']}")
 
 # Final Analysis
-print("\nFinal Analysis")
-print("-"*30)
-print("Based on methodology assessment and approach evaluation:")
+out.append("\nFinal Analysis")
+out.append("-"*30)
+out.append("Based on methodology assessment and approach evaluation:")
 top_rec = decision_result["recommendations"][0]
-print(f"- Selected Approach: {top_rec['option']['name']}")
-print(f"- Confidence Level: {top_rec['score']:.2f}")
-print(f"- Key Factors: {top_rec['reasoning']}")
\ No newline at end of file
+out.append(f"- Selected Approach: {top_rec['option']['name']}")
+out.append(f"- Confidence Level: {top_rec['score']:.2f}")
+out.append(f"- Key Factors: {top_rec['reasoning']}")
+
+# Write the report in one call
+sys.stdout.write("\n".join(out) + "\n")
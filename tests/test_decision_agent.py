@@ -1,8 +1,15 @@
+import asyncio
+import copy
+import json
 import unittest
-from yara.agents.decision_agent import DecisionAgent
+import warnings
+from unittest import mock
+from yara.agents import _decision_kernels, decision_agent
+from yara.agents.decision_agent import DecisionAgent, get_default_agent
 
 class TestDecisionAgent(unittest.TestCase):
     def setUp(self):
+        # A fresh agent per test, so results never come from another test's cache
         self.agent = DecisionAgent()
         
         # Simple test data
@@ -130,5 +137,132 @@ class TestDecisionAgent(unittest.TestCase):
         for reason in top_rec["reasoning"].split(" | "):
             print(f"└── {reason}")
 
+    def test_top_three_selection(self):
+        options = [{"name": f"Option {i}", "novelty": (i * 37 % 100) / 100} for i in range(100)]
+        result = self.agent.execute({"type": "decision", "data": options, "criteria": {"novelty": 1.0}})
+
+        names = [rec["option"]["name"] for rec in result["recommendations"]]
+        expected = [opt["name"] for opt in sorted(options, key=lambda o: o["novelty"], reverse=True)[:3]]
+        self.assertEqual(names, expected)
+        self.assertEqual(result["recommendations"][0]["score"], 1.0)
+
+    def test_options_not_mutated(self):
+        options = copy.deepcopy(self.test_task["data"])
+        # Bypass memoization so the scoring pass itself is exercised
+        self.agent._execute(self.test_task)
+        self.assertEqual(self.test_task["data"], options)
+
+    def test_aexecute_concurrent(self):
+        async def run_both():
+            return await asyncio.gather(self.agent.aexecute(self.test_task),
+                                        self.agent.aexecute({"type": "summarization"}))
+
+        decision, other = asyncio.run(run_both())
+        self.assertEqual(decision, self.agent.execute(self.test_task))
+        self.assertEqual(other["recommendation"], "N/A (not applicable for this task)")
+
+    def test_execute_memoized(self):
+        agent = DecisionAgent()
+        first = agent.execute(self.test_task)
+        first["recommendations"].clear()
+
+        second = agent.execute(copy.deepcopy(self.test_task))
+        self.assertEqual(len(agent._result_cache), 1)
+        self.assertEqual(second["recommendations"][0]["option"]["name"], "Option A")
+
+    def test_make_classification(self):
+        result = self.agent._make_classification(
+            self.test_task["data"], {"features": ["novelty", "research_impact"], "threshold": 0.5})
+
+        labels = [c["classification"] for c in result["classifications"]]
+        self.assertEqual(labels, ["accept", "reject", "reject"])
+        self.assertAlmostEqual(result["classifications"][0]["confidence"], 0.5)
+
+    def test_sharded_scoring_matches_serial(self):
+        options = [{"name": f"Option {i}", "novelty": (i * 37 % 100) / 100, "research_impact": i % 17}
+                   for i in range(100)]
+        task = {"type": "decision", "data": options, "criteria": {"novelty": 0.4, "research_impact": 0.6}}
+
+        serial = DecisionAgent().execute(task)
+        kernel = mock.Mock(wraps=_decision_kernels.score_all)
+        with mock.patch.object(decision_agent, "PARALLEL_THRESHOLD", 10), \
+                mock.patch.object(decision_agent.os, "cpu_count", return_value=4), \
+                mock.patch.object(_decision_kernels, "scoring_kernel", return_value=kernel):
+            sharded = DecisionAgent().execute(task)
+        self.assertEqual(kernel.call_count, 4)
+        self.assertEqual(sharded, serial)
+
+    def test_json_encoded_data(self):
+        expected = self.agent.execute(self.test_task)["recommendations"]
+        encoded = json.dumps({"options": self.test_task["data"]})
+
+        for data in (encoded, {"content": encoded}):
+            task = dict(self.test_task, data=data)
+            self.assertEqual(self.agent.execute(task)["recommendations"], expected)
+
+        # NaN/Infinity literals parse whether or not orjson is installed
+        task = {"type": "decision", "criteria": self.test_task["criteria"],
+                "data": '[{"name": "Option N", "novelty": 0.8, "research_impact": 50, "price": NaN}]'}
+        self.assertEqual(self.agent.execute(task)["recommendations"][0]["option"]["name"], "Option N")
+
+        task = dict(self.test_task, data="not json")
+        self.assertEqual(self.agent.execute(task)["recommendations"], [])
+
+    def test_default_agent_is_shared(self):
+        self.assertIs(get_default_agent(), get_default_agent())
+
+    def test_execute_without_option(self):
+        full = self.agent.execute(self.test_task)["recommendations"]
+        slim = self.agent.execute(self.test_task, include_option=False)["recommendations"]
+
+        self.assertEqual([rec["option_name"] for rec in slim], [rec["option"]["name"] for rec in full])
+        self.assertEqual(slim[0]["option_index"], 0)
+        self.assertNotIn("option", slim[0])
+
+    def test_top_three_ties_keep_input_order(self):
+        novelty = [0.9, 0.5, 0.5, 0.5, 0.5, 0.2, 0.5, 0.8]
+        options = [{"name": f"O{i}", "novelty": value} for i, value in enumerate(novelty)]
+        result = self.agent.execute({"type": "decision", "data": options, "criteria": {"novelty": 1.0}})
+
+        names = [rec["option"]["name"] for rec in result["recommendations"]]
+        self.assertEqual(names, ["O0", "O7", "O1"])
+
+    def test_unrolled_kernel_matches_generic(self):
+        options = [{"name": f"Option {i}", "novelty": (i * 37 % 100) / 100, "research_impact": i % 17}
+                   for i in range(20)]
+        task = {"type": "decision", "data": options, "criteria": {"novelty": 0.4, "research_impact": 0.6}}
+
+        generic = DecisionAgent().execute(task)
+        with mock.patch.object(_decision_kernels, "UNROLL_THRESHOLD", 0):
+            unrolled = DecisionAgent().execute(task)
+        self.assertEqual([rec["option"]["name"] for rec in unrolled["recommendations"]],
+                         [rec["option"]["name"] for rec in generic["recommendations"]])
+        for a, b in zip(unrolled["recommendations"], generic["recommendations"]):
+            self.assertAlmostEqual(a["score"], b["score"], places=5)
+
+    def test_large_tasks_skip_cache(self):
+        agent = DecisionAgent()
+        with mock.patch.object(decision_agent, "CACHE_MAX_OPTIONS", 2):
+            result = agent.execute(self.test_task)
+        self.assertEqual(result["recommendations"][0]["option"]["name"], "Option A")
+        self.assertEqual(len(agent._result_cache), 0)
+
+    def test_non_json_tasks_skip_cache(self):
+        agent = DecisionAgent()
+        as_tuple = agent.execute(dict(self.test_task, data=tuple(self.test_task["data"])))
+        as_list = agent.execute(self.test_task)
+
+        self.assertEqual(as_tuple["recommendations"], [])
+        self.assertEqual(as_list["recommendations"][0]["option"]["name"], "Option A")
+        self.assertEqual(len(agent._result_cache), 1)
+
+    def test_all_zero_scores(self):
+        options = [{"name": "Option X", "novelty": 0}, {"name": "Option Y", "novelty": 0}]
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            result = self.agent.execute({"type": "decision", "data": options, "criteria": {"novelty": 1.0}})
+
+        self.assertEqual([rec["score"] for rec in result["recommendations"]], [0.0, 0.0])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,66 @@
+"""Numeric kernels for DecisionAgent scoring"""
+from typing import Callable, Dict
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; kernels then run as plain NumPy
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# fastmath without nnan/ninf: filtered options are marked with -inf
+_FASTMATH = {"reassoc", "contract", "arcp", "nsz"}
+
+# Criteria counts above this use the generic loop kernel
+MAX_UNROLLED_CRITERIA = 16
+
+# Option count from which an unrolled kernel is worth compiling. Generated
+# kernels cannot be disk-cached, so each process pays ~0.4s per criteria count;
+# below this size the disk-cached score_all is used instead.
+UNROLL_THRESHOLD = 1_000_000
+
+_kernel_cache: Dict[int, Callable] = {}
+
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def score_all(novelty, research, crit_values, weights, availability_match, complexity_match, mask):
+    """Score every option in one pass; options outside mask score -inf"""
+    # float32 constants keep the arithmetic in float32 under Numba
+    s = novelty * np.float32(0.5) + research * np.float32(0.7)
+    for j in range(crit_values.shape[1]):
+        s += crit_values[:, j] * weights[j]
+    s = np.where(availability_match, s + np.float32(1.0), s)
+    s = np.where(complexity_match, s * np.float32(1.1), s)
+    s[~mask] = -np.inf
+    return s
+
+
+def scoring_kernel(n_criteria: int, n_options: int) -> Callable:
+    """Return the kernel for scoring n_options options against n_criteria columns
+
+    Large inputs get a score_all variant with the criterion loop unrolled;
+    everything else uses score_all itself.
+    """
+    if n_options < UNROLL_THRESHOLD or n_criteria > MAX_UNROLLED_CRITERIA:
+        return score_all
+
+    kernel = _kernel_cache.get(n_criteria)
+    if kernel is None:
+        # Generated from column indices only, never from criterion names
+        terms = "".join(f" + crit_values[:, {j}] * weights[{j}]" for j in range(n_criteria))
+        source = (
+            "def score(novelty, research, crit_values, weights, availability_match, complexity_match, mask):\n"
+            f"    s = novelty * np.float32(0.5) + research * np.float32(0.7){terms}\n"
+            "    s = np.where(availability_match, s + np.float32(1.0), s)\n"
+            "    s = np.where(complexity_match, s * np.float32(1.1), s)\n"
+            "    s[~mask] = -np.inf\n"
+            "    return s\n"
+        )
+        namespace = {"np": np}
+        exec(source, namespace)
+        # Generated functions have no source file, so they cannot use cache=True
+        kernel = _kernel_cache.setdefault(n_criteria, njit(nogil=True, fastmath=_FASTMATH)(namespace["score"]))
+    return kernel
@@ -1,176 +1,305 @@
-from typing import Dict, Any, List, Optional, Tuple
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Any, List, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass
+import copy
+import functools
+import hashlib
 import logging
-from sklearn.preprocessing import MinMaxScaler
-import numpy as np
+import os
+import threading
 import json
 
-class DecisionAgent:
-    def __init__(self):
-        self.logger = logging.getLogger("YARA.DecisionAgent")
-        self.scaler = MinMaxScaler()
-
-    def _calculate_option_score(self, 
-                              option: Dict[str, Any], 
-                              normalized_criteria: Dict[str, float],
-                              user_prefs: Dict[str, Any]) -> Optional[float]:
-        """Calculate score for a single option"""
-        # Check required features
-        if "required_features" in user_prefs:
-            option_features = set(option.get("features", []))
-            required_features = set(user_prefs["required_features"])
-            if not required_features.issubset(option_features):
-                return None
-
-        # Check constraints
-        if "max_price" in user_prefs and option.get("price", float("inf")) > user_prefs["max_price"]:
-            return None
-        if "min_quality" in user_prefs and option.get("quality", 0) < user_prefs["min_quality"]:
-            return None
-
-        # Base score
-        score = 0.0
-
-        # Add availability preference
-        if "preferred_availability" in user_prefs and user_prefs["preferred_availability"] == option.get("availability"):
-            score += 1.0
-
-        # Add novelty score (50% weight)
-        novelty_score = option.get("novelty", 0)
-        score += novelty_score * 0.5
-
-        # Add research impact score (70% weight)
-        research_score = option.get("research_impact_score", 0)
-        score += research_score * 0.7
-
-        # Add weighted criteria scores
-        for criterion, weight in normalized_criteria.items():
-            if criterion in option and isinstance(option[criterion], (int, float)):
-                value = float(option[criterion])
-                # Normalize value against maximum in options if needed
-                score += value * weight
-
-        # Add complexity match bonus (10%)
-        if option.get("implementation_complexity") == user_prefs.get("implementation_complexity"):
-            score *= 1.1
-
-        return score
-
-    def _generate_reasoning(self, 
-                          option: Dict[str, Any], 
-                          score: float,
-                          user_prefs: Dict[str, Any]) -> str:
-        """Generate reasoning for recommendation"""
-        reasons = []
-        
-        if option.get("novelty", 0) > 0.7:
-            reasons.append("High novelty factor")
-        
-        if option.get("research_impact_score", 0) > 0.7:
-            reasons.append("Strong research impact potential")
-        
-        if option.get("implementation_complexity") == user_prefs.get("implementation_complexity"):
-            reasons.append("Matches preferred implementation complexity")
-        
-        if option.get("features", []):
-            matched_features = set(option["features"]).intersection(
-                set(user_prefs.get("required_features", [])))
-            if matched_features:
-                reasons.append(f"Contains required features: {', '.join(matched_features)}")
-
-        if not reasons:
-            reasons.append("Based on overall score analysis")
-
-        return " | ".join(reasons)
-
-    def execute(self, task: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute decision tasks with research metrics"""
-        # Validate task type
-        if task.get("type") != "decision":
-            return {
-                "type": "recommendation",
-                "recommendation": "N/A (not applicable for this task)"
-            }
-
-        # Extract data, user preferences, and criteria
-        data = task.get("data", {})
-        user_prefs = task.get("user_preferences", {})
-        task_criteria = task.get("criteria", {})
-
-        # Parse data if it's a string
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the standard library parser
+    _loads = json.loads
+
+# numpy, the scoring kernels, asyncio and concurrent.futures are imported where
+# used, so importing this module stays cheap for flows that never make a decision
+if TYPE_CHECKING:
+    import numpy as np
+
+# Number of decision results memoized per agent
+RESULT_CACHE_SIZE = 256
+
+# Tasks with more options than this skip memoization: fingerprinting them
+# costs about as much as scoring them
+CACHE_MAX_OPTIONS = 10_000
+
+# Option count above which scoring is sharded across threads
+PARALLEL_THRESHOLD = 10_000
+
+# Reasoning text for every combination of the four reason bits
+_REASONS = (
+    "High novelty factor",
+    "Strong research impact potential",
+    "Matches preferred implementation complexity",
+    "Contains required features: {features}",
+)
+_REASON_TABLE = tuple(
+    " | ".join(reason for bit, reason in enumerate(_REASONS) if bits >> bit & 1)
+    or "Based on overall score analysis"
+    for bits in range(1 << len(_REASONS))
+)
+
+
+def _is_plain_json(obj: Any) -> bool:
+    """Whether json.dumps round-trips obj without conflating it with another value
+
+    Tuples, sets and non-string dict keys would serialize like lists or string
+    keys that execute treats differently, so tasks containing them are uncacheable.
+    """
+    if obj is None or isinstance(obj, (str, int, float)):
+        return True
+    if isinstance(obj, list):
+        return all(_is_plain_json(item) for item in obj)
+    if isinstance(obj, dict):
+        return all(isinstance(key, str) and _is_plain_json(value) for key, value in obj.items())
+    return False
+
+
+def _option_count(data: Any) -> int:
+    """Number of options in already-decoded task data; 0 for JSON strings"""
+    if isinstance(data, dict):
+        data = data.get("content", data)
+        if isinstance(data, dict):
+            data = data.get("options", [])
+    return len(data) if isinstance(data, list) else 0
+
+
+def _extract_options(data: Any) -> List[Dict[str, Any]]:
+    """Extract the option list from raw, JSON-encoded or nested task data"""
+    if isinstance(data, str):
+        data = _parse_json(data)
+    if isinstance(data, dict):
+        data = data.get("content", data)
         if isinstance(data, str):
-            try:
-                data = json.loads(data)
-            except json.JSONDecodeError:
-                data = {}
-
-        # Extract options from data
-        options = []
-        if isinstance(data, list):
-            options = data
-        elif isinstance(data, dict):
-            content = data.get("content", data)
-            if isinstance(content, str):
-                try:
-                    content = json.loads(content)
-                except json.JSONDecodeError:
-                    content = {}
-            options = content.get("options", []) if isinstance(content, dict) else content
+            data = _parse_json(data)
+    if isinstance(data, dict):
+        return data.get("options", [])
+    return data if isinstance(data, list) else []
+
+
+def _parse_json(text: str) -> Any:
+    try:
+        return _loads(text)
+    except json.JSONDecodeError:
+        pass
+    # orjson rejects NaN/Infinity literals that the standard library accepts
+    if _loads is not json.loads:
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            pass
+    return {}
+
+
+def _min_max_scale(matrix: np.ndarray) -> np.ndarray:
+    """Scale each column to [0, 1]; constant columns map to 0"""
+    col_min = matrix.min(axis=0)
+    col_range = matrix.max(axis=0) - col_min
+    col_range[col_range == 0] = 1
+    return (matrix - col_min) / col_range
+
+
+@functools.lru_cache(maxsize=64)
+def _normalize_criteria(items: Tuple[Tuple[str, float], ...]) -> Tuple[Tuple[str, ...], np.ndarray]:
+    """Normalize criteria weights to sum to 1; returns criterion names and weight vector"""
+    import numpy as np
+
+    total_weight = sum(weight for _, weight in items)
+    if total_weight == 0:
+        total_weight = 1
+    weights = np.array([weight / total_weight for _, weight in items], dtype=np.float32)
+    weights.flags.writeable = False  # shared between calls through the cache
+    return tuple(key for key, _ in items), weights
+
+
+@dataclass
+class _DecisionTask:
+    """Decision task fields normalized once from the incoming task dict"""
+    __slots__ = ("options", "user_prefs", "criteria")
+
+    options: List[Dict[str, Any]]
+    user_prefs: Dict[str, Any]
+    criteria: Dict[str, Any]
+
+    @classmethod
+    def from_task(cls, task: Dict[str, Any]) -> "_DecisionTask":
+        return cls(_extract_options(task.get("data", {})),
+                   task.get("user_preferences", {}),
+                   task.get("criteria", {}))
 
-        if not options:
-            return {
-                "type": "recommendation",
-                "message": "No options available for decision making",
-                "recommendations": []
-            }
 
-        # Normalize research impact scores
-        max_impact = max((opt.get("research_impact", 0) for opt in options), default=100)
+class DecisionAgent:
+    def __init__(self):
+        self.logger = logging.getLogger("YARA.DecisionAgent")
+        self._result_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _option_arrays(self,
+                       options: List[Dict[str, Any]],
+                       criteria_keys: Tuple[str, ...],
+                       req_set: frozenset,
+                       user_prefs: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        """Collect per-option fields into struct-of-arrays columns in a single pass"""
+        import numpy as np
+
+        # Give each required feature a bit so the subset test becomes a mask comparison
+        feature_bits = {feature: 1 << i for i, feature in enumerate(req_set)} if len(req_set) <= 64 else None
+        preferred_availability = user_prefs.get("preferred_availability")
+        complexity = user_prefs.get("implementation_complexity")
+        max_price = user_prefs.get("max_price")
+        min_quality = user_prefs.get("min_quality")
+
+        novelty, impacts, has_impact, values = [], [], [], []
+        availability_match, complexity_match, option_bits, mask = [], [], [], []
+        max_impact = 0
         for opt in options:
-            if "research_impact" in opt:
-                opt["research_impact_score"] = opt["research_impact"] / max_impact
+            novelty.append(opt.get("novelty", 0))
 
-        # Prepare scoring criteria
-        numeric_fields = [k for k, v in (options[0] if options else {}).items() 
-                        if isinstance(v, (int, float))]
-        criteria = task_criteria if task_criteria else {field: 1.0 for field in numeric_fields}
-        
-        # Normalize weights
-        total_weight = sum(criteria.values())
-        if total_weight == 0:
-            total_weight = 1
-        normalized_criteria = {k: v/total_weight for k, v in criteria.items()}
-
-        # Score options
-        scored_options = []
-        for option in options:
-            score = self._calculate_option_score(option, normalized_criteria, user_prefs)
-            if score is not None:  # None indicates option should be filtered out
-                scored_options.append((option, score))
-
-        if not scored_options:
-            return {
-                "type": "recommendation",
-                "message": "No suitable options found after applying criteria",
-                "recommendations": []
-            }
-
-        # Sort by score and normalize scores
-        ranked_options = sorted(scored_options, key=lambda x: x[1], reverse=True)
-        max_score = max(s[1] for s in scored_options)
-
-        # Generate recommendations with reasoning
-        recommendations = []
-        for opt, score in ranked_options[:3]:  # Top 3 recommendations
-            recommendations.append({
-                "option": opt,
-                "score": float(score / max_score),  # Normalize to [0,1]
-                "reasoning": self._generate_reasoning(opt, score, user_prefs)
-            })
+            # Raw research impact, normalized below once its maximum is known
+            if "research_impact" in opt:
+                impact = opt["research_impact"]
+                if impact > max_impact:
+                    max_impact = impact
+                impacts.append(impact)
+                has_impact.append(True)
+            else:
+                impacts.append(opt.get("research_impact_score", 0))
+                has_impact.append(False)
+
+            # Non-numeric or missing criterion values contribute nothing
+            row = []
+            for key in criteria_keys:
+                value = opt.get(key)
+                row.append(float(value) if isinstance(value, (int, float)) else 0.0)
+            values.append(row)
+
+            availability_match.append(
+                "preferred_availability" in user_prefs and opt.get("availability") == preferred_availability)
+            complexity_match.append(opt.get("implementation_complexity") == complexity)
+
+            # Check required features and constraints
+            if feature_bits is None:
+                has_features = req_set.issubset(opt.get("features", []))
+            else:
+                bits = 0
+                if req_set:
+                    for feature in opt.get("features", []):
+                        bits |= feature_bits.get(feature, 0)
+                option_bits.append(bits)
+                has_features = True
+            mask.append(has_features
+                        and (max_price is None or opt.get("price", float("inf")) <= max_price)
+                        and (min_quality is None or opt.get("quality", 0) >= min_quality))
+
+        mask = np.array(mask, dtype=bool)
+        if feature_bits is not None and req_set:
+            required_mask = np.uint64((1 << len(req_set)) - 1)
+            mask &= (np.array(option_bits, dtype=np.uint64) & required_mask) == required_mask
+
+        # Normalize research impact scores without touching the caller's options
+        impacts = np.array(impacts, dtype=np.float64)
+        research = np.where(has_impact, impacts / (max_impact or 1), impacts).astype(np.float32)
+
+        # float32 columns halve memory traffic; scores are only reported to two decimals
+        values = np.array(values, dtype=np.float32).reshape(len(options), len(criteria_keys))
+        if "research_impact_score" in criteria_keys:
+            values[:, criteria_keys.index("research_impact_score")] = research
+
+        novelty = np.array(novelty, dtype=np.float32)
+        complexity_match = np.array(complexity_match, dtype=bool)
+
+        # Reasoning factors as bits: novelty, research impact, complexity, required features
+        threshold = np.float32(0.7)
+        reason_bits = ((novelty > threshold).astype(np.uint8)
+                       | (research > threshold).astype(np.uint8) << 1
+                       | complexity_match.astype(np.uint8) << 2)
+        if req_set:
+            reason_bits |= 1 << 3
 
         return {
-            "type": "recommendation",
-            "recommendations": recommendations
+            "novelty": novelty,
+            "research": research,
+            "values": values,
+            "availability_match": np.array(availability_match, dtype=bool),
+            "complexity_match": complexity_match,
+            "mask": mask,
+            "reason_bits": reason_bits,
         }
+
+    def _score(self, arrays: Dict[str, np.ndarray], weights: np.ndarray) -> np.ndarray:
+        """Run the scoring kernel, sharding large option sets across threads"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        import numpy as np
+        from ._decision_kernels import scoring_kernel
+
+        names = ("novelty", "research", "values", "availability_match", "complexity_match", "mask")
+        n = len(arrays["mask"])
+        score_all = scoring_kernel(weights.size, n)
+        workers = os.cpu_count() or 1
+        if n < PARALLEL_THRESHOLD or workers == 1:
+            return score_all(arrays["novelty"], arrays["research"], arrays["values"], weights,
+                             arrays["availability_match"], arrays["complexity_match"], arrays["mask"])
+
+        # The kernel releases the GIL, so contiguous shards score in parallel
+        edges = np.linspace(0, n, workers + 1).astype(int)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = []
+            for start, stop in zip(edges[:-1], edges[1:]):
+                shard = {name: arrays[name][start:stop] for name in names}
+                futures.append(executor.submit(
+                    score_all, shard["novelty"], shard["research"], shard["values"], weights,
+                    shard["availability_match"], shard["complexity_match"], shard["mask"]))
+            return np.concatenate([future.result() for future in futures])
+
+    def _generate_reasoning(self, reason_bits: int, matched_features: str) -> str:
+        """Generate reasoning for recommendation from its reason bits"""
+        reasoning = _REASON_TABLE[reason_bits]
+        # Recommended options passed the filter, so every required feature is present
+        return reasoning.format(features=matched_features) if reason_bits & 8 else reasoning
+
+    def execute(self, task: Dict[str, Any], include_option: bool = True) -> Dict[str, Any]:
+        """Execute decision tasks with research metrics, memoized by task fingerprint
+
+        With include_option=False, recommendations carry the option's index and
+        name instead of the full option dict.
+        """
+        if task.get("type") != "decision" or _option_count(task.get("data")) > CACHE_MAX_OPTIONS:
+            return self._execute(task, include_option)
+
+        # Scoring is pure given the task, so identical tasks share one result
+        try:
+            cacheable = _is_plain_json(task)
+        except RecursionError:  # circular or very deeply nested task
+            cacheable = False
+        if not cacheable:
+            return self._execute(task, include_option)
+        canonical = json.dumps({"task": task, "include_option": include_option}, sort_keys=True)
+        key = hashlib.sha256(canonical.encode()).hexdigest()
+
+        with self._cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                self._result_cache.move_to_end(key)
+                return copy.deepcopy(cached)
+
+        result = self._execute(task, include_option)
+        with self._cache_lock:
+            self._result_cache[key] = copy.deepcopy(result)
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        return result
+
+    def _execute(self, task: Dict[str, Any], include_option: bool = True) -> Dict[str, Any]:
+        """Execute decision tasks with research metrics"""
+        import numpy as np
+
         # Validate task type
         if task.get("type") != "decision":
             return {
@@ -178,29 +307,11 @@ class DecisionAgent:
                 "recommendation": "N/A (not applicable for this task)"
             }
 
-        # Extract data, user preferences, and criteria
-        data = task.get("data", {})
-        user_prefs = task.get("user_preferences", {})
-        task_criteria = task.get("criteria", {})
-
-        # Parse data if it's a string
-        if isinstance(data, str):
-            try:
-                data = json.loads(data)
-            except json.JSONDecodeError:
-                data = {}
-
-        # Extract options from data
-        options = []
-        if isinstance(data, list):
-            options = data
-        elif isinstance(data, dict):
-            options = data.get("options", [])
-            if isinstance(options, str):
-                try:
-                    options = json.loads(options)
-                except json.JSONDecodeError:
-                    options = []
+        # Normalize the task dict once
+        decision = _DecisionTask.from_task(task)
+        options = decision.options
+        user_prefs = decision.user_prefs
+        task_criteria = decision.criteria
 
         if not options:
             return {
@@ -208,192 +319,122 @@ class DecisionAgent:
                 "message": "No options available for decision making",
                 "recommendations": []
             }
-        task_type = task.get("type", "unknown")
-        if task_type != "decision":
-            return {
-                "type": "recommendation",
-                "recommendation": "N/A (not applicable for this task)"
-            }
 
-        # Get data from either task data or previous retrieval result
-        data = task.get("data", {})
-        if isinstance(data, dict) and "content" in data:
-            data = data["content"]
-            
-        if isinstance(data, str):
-            try:
-                import json
-                data = json.loads(data)
-            except:
-                data = {}
-                
-            # Handle both direct options and nested options
-        options = []
-        if isinstance(data, list):
-            options = data
-        elif isinstance(data, dict):
-            options = data.get("options", [])
-        
-        # Get user preferences and criteria
-        user_prefs = task.get("user_preferences", {})
-        task_criteria = task.get("criteria", {})
-        
-        # Convert research_impact to normalized score
-        max_impact = max((opt.get("research_impact", 0) for opt in options), default=100)
-        for opt in options:
-            if "research_impact" in opt:
-                opt["research_impact_score"] = opt["research_impact"] / max_impact
-        
-        self.logger.info(f"Making recommendation with {len(options)} options")
-
-        # Normalize the criteria
-        criteria = {}
-        for key, value in task_criteria.items():
-            if isinstance(value, (int, float)):
-                criteria[key] = float(value)
-        
-        if not options:
+        # Prepare scoring criteria
+        if task_criteria:
+            criteria = task_criteria
+        else:
+            criteria = {k: 1.0 for k, v in options[0].items() if isinstance(v, (int, float))}
+            if "research_impact" in options[0]:
+                criteria["research_impact_score"] = 1.0
+
+        # Normalize weights (cached, since most requests reuse the same criteria)
+        criteria_keys, weights = _normalize_criteria(tuple(sorted(criteria.items())))
+
+        # Score all options in one vectorized pass
+        req_set = frozenset(user_prefs.get("required_features", ()))
+        arrays = self._option_arrays(options, criteria_keys, req_set, user_prefs)
+        scores = self._score(arrays, weights)
+        valid = np.flatnonzero(scores > -np.inf)
+
+        if valid.size == 0:
             return {
                 "type": "recommendation",
-                "message": "No options available for decision making",
+                "message": "No suitable options found after applying criteria",
                 "recommendations": []
             }
 
-        # Combine user preferences with criteria
-        combined_criteria = {}
-        if "max_price" in user_prefs:
-            combined_criteria["price"] = lambda x: 1.0 if x <= user_prefs["max_price"] else 0.0
-        if "min_quality" in user_prefs:
-            combined_criteria["quality"] = lambda x: 1.0 if x >= user_prefs["min_quality"] else 0.0
-        
-        # Add weighted criteria from task
-        for key, weight in criteria.items():
-            if key in combined_criteria:
-                continue
-            combined_criteria[key] = lambda x, w=weight: float(x) * float(w)
-
-        # Score each option
-        scored_options = []
-        for option in options:
-            base_score = 0.0
-            valid_option = True
-            
-            # Check required features
-            if "required_features" in user_prefs:
-                option_features = set(option.get("features", []))
-                required_features = set(user_prefs["required_features"])
-                if not required_features.issubset(option_features):
-                    continue
-
-            # Check constraints
-            if "max_price" in user_prefs and option.get("price", float("inf")) > user_prefs["max_price"]:
-                continue
-            if "min_quality" in user_prefs and option.get("quality", 0) < user_prefs["min_quality"]:
-                continue
-            
-            # Add base score for availability preference
-            if "preferred_availability" in user_prefs and user_prefs["preferred_availability"] == option.get("availability"):
-                base_score += 1.0
-                
-            # Add novelty score
-            novelty_score = option.get("novelty", 0)
-            if novelty_score > 0:
-                base_score += novelty_score * 0.5  # Weight novelty at 50%
-                
-            # Add research impact score
-            research_score = option.get("research_impact_score", 0)
-            if research_score > 0:
-                base_score += research_score * 0.7  # Weight research impact at 70%
-
-            # Calculate weighted score based on research criteria
-            total_weight = 0
-            for key, weight in criteria.items():
-                if key == "research_impact" and "research_impact_score" in option:
-                    base_score += weight * option["research_impact_score"]
-                    total_weight += weight
-                elif key == "novelty" and key in option:
-                    base_score += weight * option[key]
-                    total_weight += weight
-                elif key in option and isinstance(option[key], (int, float)):
-                    normalized_value = option[key] / max((opt.get(key, 1) for opt in options), default=1)
-                    base_score += weight * normalized_value
-                    total_weight += weight
-
-            # Normalize the score
-            if total_weight > 0:
-                base_score = base_score / total_weight
-
-            if valid_option:
-                # Add implementation complexity bonus/penalty
-                if option.get("implementation_complexity") == user_prefs.get("implementation_complexity"):
-                    base_score *= 1.1  # 10% bonus for matching complexity preference
-                
-                scored_options.append({
-                    "option": option,
-                    "score": base_score
-                })
-
-        # Sort by score
-        scored_options.sort(key=lambda x: x["score"], reverse=True)
-        
-        # Calculate statistical metrics
-        scores = [opt["score"] for opt in scored_options]
-        stats = {
-            "mean_score": float(np.mean(scores)) if scores else 0,
-            "std_dev": float(np.std(scores)) if scores else 0,
-            "median": float(np.median(scores)) if scores else 0,
-            "min_score": float(np.min(scores)) if scores else 0,
-            "max_score": float(np.max(scores)) if scores else 0,
-            "total_options": len(options),
-            "valid_options": len(scored_options),
-            "criteria_weights": criteria,
-            "timestamp": task.get("timestamp", ""),
-        }
-
-        # Add percentile rankings
-        if scores:
-            percentiles = [25, 50, 75, 90]
-            stats["percentiles"] = {
-                f"p{p}": float(np.percentile(scores, p))
-                for p in percentiles
+        # Select the top 3 (partial selection, then order only those) and normalize scores.
+        # Every option tied with the 3rd-best score stays a candidate, and the stable
+        # sort over candidates in index order keeps input order on ties.
+        valid_scores = scores[valid]
+        if valid.size > 3:
+            third = np.partition(valid_scores, -3)[-3]
+            candidates = np.flatnonzero(valid_scores >= third)
+        else:
+            candidates = np.arange(valid.size)
+        top = candidates[np.argsort(-valid_scores[candidates], kind="stable")][:3]
+        ranked = valid[top]
+        max_score = scores[ranked[0]]
+        if max_score == 0:
+            max_score = 1  # all-zero scores: report them unnormalized rather than as NaN
+
+        # Generate recommendations with reasoning for the top 3
+        reason_bits = arrays["reason_bits"]
+        matched_features = ", ".join(sorted(req_set))
+
+        def option_fields(i: int) -> Dict[str, Any]:
+            if include_option:
+                return {"option": options[i]}
+            return {"option_index": int(i), "option_name": options[i].get("name")}
+
+        recommendations = [
+            {
+                **option_fields(i),
+                "score": float(scores[i] / max_score),  # Normalize to [0,1]
+                "reasoning": self._generate_reasoning(int(reason_bits[i]), matched_features)
             }
-        
+            for i in ranked
+        ]
+
         return {
             "type": "recommendation",
             "recommendations": recommendations
         }
 
+    async def aexecute(self, task: Dict[str, Any], include_option: bool = True) -> Dict[str, Any]:
+        """Execute a decision task in a worker thread so independent tasks can run concurrently"""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(self.execute, task, include_option))
+
     def _make_classification(self, options: List[Dict[str, Any]], criteria: Dict[str, Any]) -> Dict[str, Any]:
         """Classify options based on criteria"""
+        import numpy as np
+
         threshold = criteria.get("threshold", 0.5)
         features = criteria.get("features", [])
 
         if not options or not features:
             raise ValueError("Options and features are required for classification")
 
-        classifications = []
-        for option in options:
-            # Extract feature values
-            feature_values = []
-            for feature in features:
-                value = option.get(feature, 0)
-                feature_values.append(float(value))
-
-            # Normalize features
-            normalized_values = self.scaler.fit_transform([feature_values])[0]
-            
-            # Simple threshold-based classification
-            score = np.mean(normalized_values)
-            classification = "accept" if score >= threshold else "reject"
-
-            classifications.append({
+        # Extract feature values for all options
+        feature_matrix = np.array([[float(option.get(feature, 0)) for feature in features]
+                                   for option in options], dtype=np.float64)
+
+        # Normalize each feature across options
+        normalized = _min_max_scale(feature_matrix)
+
+        # Simple threshold-based classification
+        scores = normalized.mean(axis=1)
+        labels = np.where(scores >= threshold, "accept", "reject")
+        confidences = np.abs(scores - threshold)
+
+        classifications = [
+            {
                 "option": option,
-                "classification": classification,
-                "confidence": float(abs(score - threshold))
-            })
+                "classification": str(label),
+                "confidence": float(confidence)
+            }
+            for option, label, confidence in zip(options, labels, confidences)
+        ]
 
         return {
             "type": "classification",
             "classifications": classifications,
             "threshold": threshold
         }
+
+
+@functools.lru_cache(maxsize=None)
+def get_default_agent() -> DecisionAgent:
+    """Return the process-wide DecisionAgent, warmed up so the scoring kernel is compiled"""
+    agent = DecisionAgent()
+    agent._execute({
+        "type": "decision",
+        "data": [{"name": "warm-up", "novelty": 0.5, "research_impact": 50, "features": ["core"]}],
+        "user_preferences": {"required_features": ["core"]},
+        "criteria": {"novelty": 0.5, "research_impact": 0.5}
+    })
+    return agent